@@ -1,8 +1,14 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
+import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.subplots import make_subplots
 import numpy as np
+import numexpr as ne
+import re
 from pathlib import Path
+from typing import Optional
 
 # Konfigurasi Halaman
 st.set_page_config(
@@ -13,35 +19,63 @@ st.set_page_config(
 # Load Data
 @st.cache_data
 def load_data():
-    df = pd.read_csv("Data Eda Threeasure_Updated.csv")
+    # Multithreaded Arrow reader; timestamp arrives already parsed
+    df = pd.read_csv("Data Eda Threeasure_Updated.csv", engine="pyarrow", parse_dates=["timestamp"])
     df.columns = df.columns.str.strip().str.lower()
-    if "timestamp" in df.columns:
+    if "timestamp" in df.columns and not pd.api.types.is_datetime64_any_dtype(df["timestamp"]):
+        # Only reached when read-time parsing gave up on a malformed value
         df["timestamp"] = pd.to_datetime(df["timestamp"], errors="coerce")
+    # Keep free-text answers in contiguous Arrow buffers instead of Python objects
+    text_cols = df.select_dtypes(include=["object", "string"]).columns
+    df[text_cols] = df[text_cols].astype("string[pyarrow]")
     return df
 
-def preprocess_data(df: pd.DataFrame) -> pd.DataFrame:
-    data = df.copy()
+WHITESPACE_RE = re.compile(r"\s+")
+TEXT_FIXES = {
+    "Fakultas Imu Sosial Budaya Dan Politik": "Fakultas Ilmu Sosial Budaya Dan Politik",
+}
+ORDER_HARI = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+CATEGORY_COLS = [
+    "fakultas",
+    "program_studi",
+    "kategori_fomo",
+    "kategori_keuangan",
+    "kategori_proporsi",
+    "kebutuhan_akan_dukungan_emosional_dan_bantuan_psikologis",
+]
+# Kolom tabel ringkasan halaman Eksplorasi
+SUMMARY_COLS = [
+    "nama_lengkap",
+    "fakultas",
+    "program_studi",
+    "kategori_fomo",
+    "kategori_keuangan",
+    "proporsi_fomo",
+    "skor_psikologis",
+]
+SUMMARY_RENAME = {"proporsi_fomo": "Proporsi FOMO", "skor_psikologis": "Skor Psikologis"}
+# Batas entri cache per kombinasi filter Eksplorasi (dibagi semua sesi)
+EXPLORE_CACHE_ENTRIES = 64
 
-    # Standardise categorical text
-    if "fakultas" in data.columns:
-        data["fakultas"] = (
-            data["fakultas"]
-            .astype(str)
-            .str.strip()
-            .str.replace(r"\s+", " ", regex=True)
-            .str.title()
-        )
-        data["fakultas"] = data["fakultas"].replace(
-            {
-                "Fakultas Imu Sosial Budaya Dan Politik": "Fakultas Ilmu Sosial Budaya Dan Politik",
-                "Fakultas Ilmu Sosial Budaya Dan Politik": "Fakultas Ilmu Sosial Budaya Dan Politik",
-            }
-        )
+def normalise_text(value):
+    """Collapse whitespace, title-case and fix known typos in one pass over a cell."""
+    if not isinstance(value, str):
+        return value
+    text = WHITESPACE_RE.sub(" ", value).strip().title()
+    return TEXT_FIXES.get(text, text)
 
-    if "program_studi" in data.columns:
-        data["program_studi"] = (
-            data["program_studi"].astype(str).str.strip().str.replace(r"\s+", " ", regex=True).str.title()
-        )
+def bucketize(values, bins, labels) -> pd.Categorical:
+    """Same result as pd.cut(values, bins, labels=labels, include_lowest=True), via searchsorted."""
+    values = np.asarray(values, dtype="float64")
+    # side="left" keeps the bins right-closed, e.g. 0.2 falls in [0, 0.2] like pd.cut
+    codes = np.searchsorted(bins[1:-1], values, side="left")
+    codes[np.isnan(values) | (values < bins[0]) | (values > bins[-1])] = -1
+    return pd.Categorical.from_codes(codes, categories=labels, ordered=True)
+
+def preprocess_data(df: pd.DataFrame) -> pd.DataFrame:
+    # Standardise categorical text; assign returns a new frame so the input is left untouched
+    text_cols = [c for c in ("fakultas", "program_studi") if c in df.columns]
+    data = df.assign(**{c: df[c].map(normalise_text) for c in text_cols})
 
     # Ensure numeric columns are numeric
     numeric_cols = [
@@ -57,44 +91,63 @@ def preprocess_data(df: pd.DataFrame) -> pd.DataFrame:
         "kebutuhan_akan_dukungan_emosional_dan_bantuan_psikologis_numerik",
         "skor_psikologis",
     ]
-    for col in numeric_cols:
-        if col in data.columns:
-            data[col] = pd.to_numeric(data[col], errors="coerce")
+    numeric_ok = [c for c in numeric_cols if c in data.columns]
+    if numeric_ok:
+        data[numeric_ok] = data[numeric_ok].apply(pd.to_numeric, errors="coerce")
+
+    # Scores fit float32 exactly; rupiah amounts stay float64 so their means and the
+    # proporsi_fomo bin edges (0.2 / 0.5) are not shifted by rounding
+    money_cols = ["rata-rata_uang_saku_perbulan", "pengeluaran_untuk_fomo_per_bulan"]
+    score_ok = [c for c in numeric_ok if c not in money_cols]
+    if score_ok:
+        data[score_ok] = data[score_ok].astype("float32")
+
+    # New columns are collected here and attached in one assign at the end
+    derived = {}
 
     if "timestamp" in data.columns:
-        data["hari"] = data["timestamp"].dt.day_name()
-        data["jam"] = data["timestamp"].dt.hour
-        data["minggu"] = data["timestamp"].dt.to_period("W").astype(str)
+        ts = data["timestamp"]
+        derived["hari"] = pd.Categorical(ts.dt.day_name(), categories=ORDER_HARI, ordered=True)
+        derived["jam"] = pd.to_numeric(ts.dt.hour, downcast="integer")
+        # ISO week label (e.g. 2025-W37) built from integer year/week, no Period objects
+        iso = ts.dt.isocalendar()
+        minggu = iso["year"].astype(str) + "-W" + iso["week"].astype(str).str.zfill(2)
+        derived["minggu"] = minggu.where(ts.notna()).astype("category")
 
     # Derived features to make the visuals richer
     if {"pengeluaran_untuk_fomo_per_bulan", "rata-rata_uang_saku_perbulan"}.issubset(data.columns):
-        uang = data["rata-rata_uang_saku_perbulan"].replace(0, np.nan)
-        proporsi = data["pengeluaran_untuk_fomo_per_bulan"] / uang
-        data["proporsi_fomo"] = proporsi.clip(lower=0)
-        data["sisa_uang_saku"] = data["rata-rata_uang_saku_perbulan"] - data["pengeluaran_untuk_fomo_per_bulan"]
-        data["kategori_proporsi"] = pd.cut(
-            data["proporsi_fomo"],
+        uang = data["rata-rata_uang_saku_perbulan"].to_numpy(dtype="float64")
+        spend = data["pengeluaran_untuk_fomo_per_bulan"].to_numpy(dtype="float64")
+        # Zero pocket money leaves NaN in place instead of dividing
+        proporsi = np.divide(spend, uang, out=np.full_like(spend, np.nan), where=uang != 0)
+        proporsi = np.clip(proporsi, 0, None)
+        derived["proporsi_fomo"] = proporsi
+        derived["sisa_uang_saku"] = uang - spend
+        derived["kategori_proporsi"] = bucketize(
+            proporsi,
             bins=[0, 0.2, 0.5, np.inf],
             labels=["Rendah (<20%)", "Sedang (20-50%)", "Tinggi (>50%)"],
-            include_lowest=True,
         )
 
     if "kemampuan_mengelola_keuangan" in data.columns:
-        data["kategori_keuangan"] = pd.cut(
+        derived["kategori_keuangan"] = bucketize(
             data["kemampuan_mengelola_keuangan"],
             bins=[0, 2.5, 3.5, 5],
             labels=["Kurang", "Cukup", "Baik"],
-            include_lowest=True,
         )
 
     if "sering_merasa_fomo" in data.columns:
-        data["kategori_fomo"] = (
-            data["sering_merasa_fomo"].fillna("Tidak").str.strip().str.lower().map({"ya": "Sering", "tidak": "Jarang"})
+        derived["kategori_fomo"] = (
+            data["sering_merasa_fomo"]
+            .fillna("Tidak")
+            .str.strip()
+            .str.lower()
+            .map({"ya": "Sering", "tidak": "Jarang"})
+            .fillna("Jarang")
         )
-        data["kategori_fomo"] = data["kategori_fomo"].fillna("Jarang")
 
     if {"frekuensi_fomo_pengeluaran", "frekuensi_kegiatan_karena_fomo"}.issubset(data.columns):
-        data["skor_fomo_relatif"] = (
+        derived["skor_fomo_relatif"] = (
             data[["frekuensi_fomo_pengeluaran", "frekuensi_kegiatan_karena_fomo"]].sum(axis=1)
         ) / 2
 
@@ -106,11 +159,36 @@ def preprocess_data(df: pd.DataFrame) -> pd.DataFrame:
     ]
     stress_ok = [c for c in stress_cols if c in data.columns]
     if stress_ok:
-        data["indeks_stres"] = data[stress_ok].mean(axis=1)
+        derived["indeks_stres"] = data[stress_ok].mean(axis=1)
+
+    data = data.assign(**derived)
+
+    # Group/filter keys as categoricals so groupby and equality work on integer codes
+    category_ok = [c for c in CATEGORY_COLS if c in data.columns]
+    data[category_ok] = data[category_ok].astype("category")
 
     return data
 
-df = preprocess_data(load_data())
+@st.cache_resource(show_spinner=False)
+def get_df() -> pd.DataFrame:
+    """Cleaned dataset, built once and shared as the same object on every rerun."""
+    return preprocess_data(load_data())
+
+df = get_df()
+
+# Skema dataset statis: cek ketersediaan kolom sekali saja
+HAS = {
+    "fakultas": "fakultas" in df.columns,
+    "fomo": "kategori_fomo" in df.columns,
+    "keuangan": "kategori_keuangan" in df.columns,
+    "prodi": "program_studi" in df.columns,
+    "fomo_psi": {"skor_fomo_relatif", "skor_psikologis"}.issubset(df.columns),
+    "freq_psi": {"frekuensi_fomo_pengeluaran", "skor_psikologis"}.issubset(df.columns),
+    "km_psi": {"kemampuan_mengelola_keuangan", "skor_psikologis"}.issubset(df.columns),
+    "stress": {"kategori_fomo", "indeks_stres"}.issubset(df.columns),
+    "support": "kebutuhan_akan_dukungan_emosional_dan_bantuan_psikologis" in df.columns,
+    "proporsi": "proporsi_fomo" in df.columns,
+}
 
 # Warna Palet
 SALMON = "#FA8072"
@@ -125,38 +203,93 @@ GRADIENT_SCALE = [
     [1.0, GRADIENT[4]],
 ]
 
+# Di atas batas ini predikat rentang dievaluasi multi-thread oleh numexpr
+NUMEXPR_MIN_ROWS = 100_000
+# Di atas batas ini scatter dirender via WebGL (Scattergl), bukan SVG
+WEBGL_MIN_POINTS = 2000
+
+# Tema grafik: nilai layout eksplisit, karena tema Streamlit menimpa isi layout.template
+AXIS_STYLE = dict(showgrid=True, gridcolor="rgba(201, 74, 68, 0.15)", zeroline=False, linecolor="rgba(201, 74, 68, 0.3)")
+FOMO_TEMPLATE = pio.templates["plotly_white"]
+FOMO_LAYOUT = dict(
+    template=FOMO_TEMPLATE,
+    paper_bgcolor="rgba(250, 128, 114, 0.04)",
+    plot_bgcolor="rgba(250, 128, 114, 0.02)",
+    font=dict(color="#343A40", family="Poppins, sans-serif"),
+    title=dict(font=dict(color=SALMON, size=20), x=0.5, xanchor="center", pad=dict(b=12)),
+    margin=dict(l=40, r=40, t=60, b=40),
+    legend=dict(bgcolor="rgba(255,255,255,0.6)", bordercolor="rgba(0,0,0,0)", font=dict(color="#343A40")),
+    colorway=[
+        "rgba(255,245,240,0.55)",
+        "rgba(254,224,210,0.55)",
+        "rgba(252,187,161,0.55)",
+        "rgba(252,146,114,0.55)",
+        "rgba(251,106,74,0.55)",
+        "rgba(239,59,44,0.55)"
+    ],
+)
+
+# Konten statis halaman (tidak bergantung pada data, cukup dibangun sekali)
+PENDAHULUAN_HTML = """
+<div class="card">
+    <h2>Gambaran Proyek</h2>
+    <p>
+        Dashboard ini merangkum hasil survei mengenai fenomena <em>Fear of Missing Out</em> (FOMO)
+        di kalangan mahasiswa. Fokus utamanya adalah menggali hubungan antara tekanan sosial,
+        perilaku konsumtif, dan kondisi kesejahteraan psikologis.
+    </p>
+    <p>
+        Data yang dianalisis mencakup 153 responden lintas fakultas di UPN Veteran Jawa Timur.
+        Survei menyoroti seberapa sering mahasiswa mengalami FOMO, besaran alokasi pengeluaran
+        yang terdorong oleh FOMO, hingga kemampuan mereka mengelola keuangan pribadi.
+    </p>
+    <h3>Struktur Dataset</h3>
+    <ul>
+        <li><strong>Identitas:</strong> timestamp, fakultas, program studi.</li>
+        <li><strong>FOMO &amp; Emosi:</strong> frekuensi FOMO, pengaruh terhadap emosi, indeks stres.</li>
+        <li><strong>Keuangan:</strong> uang saku bulanan, pengeluaran karena FOMO, kemampuan mengelola keuangan.</li>
+        <li><strong>Kesejahteraan:</strong> skor psikologis, kebutuhan dukungan emosional.</li>
+    </ul>
+    <p>
+        Dengan menggabungkan visualisasi interaktif dan ringkasan statistik,
+        dashboard ini diharapkan mampu menjadi referensi untuk merancang program pendampingan
+        maupun kebijakan peningkatan literasi finansial dan kesehatan mental mahasiswa.
+    </p>
+</div>
+"""
+
+KESIMPULAN_MD = """
+Berdasarkan hasil analisis:
+- Mahasiswa dengan **tingkat FOMO tinggi** cenderung memiliki **kemampuan pengelolaan keuangan yang rendah**.
+- Semakin **baik kemampuan finansial**, semakin **stabil kesejahteraan psikologis**.
+- Diperlukan peningkatan **literasi keuangan dan kesadaran digital** di kalangan mahasiswa.
+"""
+
 def set_page(page: str) -> None:
     st.session_state["page"] = page
 
-def render_plot(fig, container=None):
-    """Helper to render Plotly figures responsively."""
-    fig.update_layout(
-        template="plotly_white",
-        paper_bgcolor="rgba(250, 128, 114, 0.04)",
-        plot_bgcolor="rgba(250, 128, 114, 0.02)",
-        font=dict(color="#343A40", family="Poppins, sans-serif"),
-        title=dict(font=dict(color=SALMON, size=20), x=0.5, xanchor="center", pad=dict(b=12)),
-        margin=dict(l=40, r=40, t=60, b=40),
-        legend=dict(bgcolor="rgba(255,255,255,0.6)", bordercolor="rgba(0,0,0,0)", font=dict(color="#343A40")),
-        colorway=[
-            "rgba(255,245,240,0.55)",
-            "rgba(254,224,210,0.55)",
-            "rgba(252,187,161,0.55)",
-            "rgba(252,146,114,0.55)",
-            "rgba(251,106,74,0.55)",
-            "rgba(239,59,44,0.55)"
-        ],
-    )
+def style_plot(fig):
+    """Apply the dashboard theme as explicit layout values and return the figure."""
+    fig.update_layout(**FOMO_LAYOUT)
     fig.update_coloraxes(colorscale=GRADIENT_SCALE)
-    fig.update_xaxes(showgrid=True, gridcolor="rgba(201, 74, 68, 0.15)", zeroline=False, linecolor="rgba(201, 74, 68, 0.3)")
-    fig.update_yaxes(showgrid=True, gridcolor="rgba(201, 74, 68, 0.15)", zeroline=False, linecolor="rgba(201, 74, 68, 0.3)")
+    fig.update_xaxes(**AXIS_STYLE)
+    fig.update_yaxes(**AXIS_STYLE)
+    return fig
+
+def show_plot(fig, container=None):
+    """Send an already-styled figure to Streamlit."""
     target = container if container is not None else st
     target.plotly_chart(fig, config={"responsive": True})
 
+@st.cache_data(show_spinner=False)
+def read_css(path: str) -> str:
+    css_path = Path(path)
+    return css_path.read_text() if css_path.exists() else ""
+
 def load_local_css() -> None:
-    css_path = Path("styles/style.css")
-    if css_path.exists():
-        st.markdown(f"<style>{css_path.read_text()}</style>", unsafe_allow_html=True)
+    css = read_css("styles/style.css")
+    if css:
+        st.markdown(f"<style>{css}</style>", unsafe_allow_html=True)
 
 def render_banner(title: str, description: str) -> None:
     st.markdown(
@@ -169,6 +302,716 @@ def render_banner(title: str, description: str) -> None:
         unsafe_allow_html=True,
     )
 
+# Agregasi (di-cache karena hanya bergantung pada df; parameter `_df` tidak di-hash Streamlit)
+def count_by(df: pd.DataFrame, keys: list, name: str) -> pd.DataFrame:
+    """Row counts per key combination, like groupby(keys).size(), using value_counts."""
+    counts = df.value_counts(keys, sort=False)
+    # Categorical keys come back as a full cartesian product; keep observed combinations only
+    return counts[counts > 0].sort_index().reset_index(name=name)
+
+def masked_group_mean(df: pd.DataFrame, mask: np.ndarray, key: str, value: str, name: str) -> pd.DataFrame:
+    """Mean of `value` per observed category of `key` over masked rows, via np.bincount on codes."""
+    categories = df[key].cat.categories
+    codes = df[key].cat.codes.to_numpy()[mask]
+    values = df[value].to_numpy(dtype="float64")[mask]
+    observed = np.bincount(codes[codes >= 0], minlength=len(categories)) > 0
+    valid = (codes >= 0) & ~np.isnan(values)
+    sums = np.bincount(codes[valid], weights=values[valid], minlength=len(categories))
+    counts = np.bincount(codes[valid], minlength=len(categories))
+    means = np.divide(sums, counts, out=np.full(len(categories), np.nan), where=counts > 0)
+    return pd.DataFrame({key: categories[observed], name: means[observed]})
+
+def masked_counts(df: pd.DataFrame, mask: np.ndarray, key: str, names: list) -> pd.DataFrame:
+    """Like value_counts() on the masked rows of a categorical column, via np.bincount on codes."""
+    categories = df[key].cat.categories
+    codes = df[key].cat.codes.to_numpy()[mask]
+    counts = np.bincount(codes[codes >= 0], minlength=len(categories))
+    order = np.argsort(-counts, kind="stable")
+    order = order[counts[order] > 0]
+    return pd.DataFrame({names[0]: categories[order], names[1]: counts[order]})
+
+@st.cache_data(show_spinner=False)
+def agg_daily(_df: pd.DataFrame) -> pd.DataFrame:
+    daily = (
+        _df["timestamp"].dropna().dt.date.rename("tanggal")
+        .value_counts(sort=False)
+        .sort_index()
+        .reset_index(name="Jumlah Responden")
+    )
+    daily["Kumulatif Responden"] = daily["Jumlah Responden"].cumsum()
+    return daily
+
+@st.cache_data(show_spinner=False)
+def agg_weekly(_df: pd.DataFrame) -> pd.DataFrame:
+    return count_by(_df, ["minggu"], "Responden")
+
+@st.cache_data(show_spinner=False)
+def agg_hari_jam(_df: pd.DataFrame) -> pd.DataFrame:
+    # hari is an ordered categorical, so the sorted counts are already in weekday order
+    return count_by(_df, ["hari", "jam"], "Responden")
+
+@st.cache_data(show_spinner=False)
+def agg_fakultas(_df: pd.DataFrame) -> pd.DataFrame:
+    return (
+        count_by(_df, ["fakultas"], "Jumlah")
+        .sort_values("Jumlah", ascending=True)
+        .rename(columns={"fakultas": "Fakultas"})
+    )
+
+def box_summary(values: pd.Series) -> dict:
+    """Quartiles, 1.5 IQR whisker ends and the outliers beyond them, as Plotly draws a box."""
+    # "hazen" = Plotly's default quartilemethod="linear"
+    q1, median, q3 = np.quantile(values, [0.25, 0.5, 0.75], method="hazen")
+    iqr = q3 - q1
+    within = values.between(q1 - 1.5 * iqr, q3 + 1.5 * iqr)
+    inside = values[within]
+    return dict(
+        q1=q1,
+        median=median,
+        q3=q3,
+        lowerfence=inside.min(),
+        upperfence=inside.max(),
+        outliers=tuple(values[~within].tolist()),
+    )
+
+@st.cache_data(show_spinner=False)
+def agg_box(_df: pd.DataFrame, value_col: str, group_col: Optional[str] = None) -> pd.DataFrame:
+    data = _df.dropna(subset=[value_col])
+    if group_col is None:
+        return pd.DataFrame([box_summary(data[value_col])]) if not data.empty else pd.DataFrame()
+    return pd.DataFrame(
+        [
+            {group_col: key, **box_summary(values)}
+            for key, values in data.groupby(group_col, observed=True)[value_col]
+        ]
+    )
+
+@st.cache_data(show_spinner=False)
+def agg_trendlines(_df: pd.DataFrame, x: str, y: str, group_col: Optional[str] = None) -> pd.DataFrame:
+    """Least-squares line per group (numpy polyfit), replacing Plotly's statsmodels trendline."""
+    data = _df.dropna(subset=[x, y])
+    groups = data.groupby(group_col, observed=True) if group_col else [("Semua", data)]
+    rows = []
+    for key, part in groups:
+        xs = part[x].to_numpy(dtype="float64")
+        ys = part[y].to_numpy(dtype="float64")
+        if len(xs) < 2 or np.ptp(xs) == 0:
+            continue
+        slope, intercept = np.polyfit(xs, ys, 1)
+        residual = ys - (slope * xs + intercept)
+        total = ((ys - ys.mean()) ** 2).sum()
+        r2 = 1 - (residual ** 2).sum() / total if total else np.nan
+        rows.append(dict(group=key, slope=slope, intercept=intercept, r2=r2, x0=xs.min(), x1=xs.max()))
+    return pd.DataFrame(rows)
+
+@st.cache_data(show_spinner=False)
+def filter_options(_df: pd.DataFrame) -> dict:
+    """Eksplorasi filter options and the proporsi slider maximum, computed once per dataset."""
+    def options(col: str) -> list:
+        if col not in _df.columns:
+            return []
+        values = _df[col]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            # Categories are already ordered; no string scan or sort needed
+            return values.cat.remove_unused_categories().cat.categories.tolist()
+        return sorted(values.dropna().unique().tolist())
+
+    prop_max = None
+    if "proporsi_fomo" in _df.columns and _df["proporsi_fomo"].notna().any():
+        prop_max = float(_df["proporsi_fomo"].max())
+    return {
+        "fakultas": options("fakultas"),
+        "fomo": options("kategori_fomo"),
+        "keuangan": options("kategori_keuangan"),
+        "prodi": options("program_studi"),
+        "prop_max": prop_max,
+    }
+
+@st.cache_resource(show_spinner=False, max_entries=EXPLORE_CACHE_ENTRIES)
+def build_views(
+    _df: pd.DataFrame,
+    fakultas: str,
+    fomo: str,
+    keuangan: str,
+    prop_range: Optional[tuple],
+    program: tuple,
+) -> dict:
+    """Filtered rows and aggregates for the Eksplorasi page, cached per filter combination (shared, do not modify)."""
+    # One fused mask, indexed once
+    mask = np.ones(len(_df), dtype=bool)
+    if fakultas != "Semua":
+        mask &= (_df["fakultas"] == fakultas).to_numpy()
+    if fomo != "Semua" and "kategori_fomo" in _df.columns:
+        mask &= (_df["kategori_fomo"] == fomo).to_numpy()
+    if keuangan != "Semua" and "kategori_keuangan" in _df.columns:
+        mask &= (_df["kategori_keuangan"] == keuangan).to_numpy()
+    if prop_range and "proporsi_fomo" in _df.columns:
+        lower, upper = prop_range
+        prop = _df["proporsi_fomo"].to_numpy()
+        if len(prop) > NUMEXPR_MIN_ROWS:
+            mask &= ne.evaluate("(prop >= lower) & (prop <= upper)")
+        else:
+            mask &= np.logical_and(prop >= lower, prop <= upper)
+    if program:
+        prodi = _df["program_studi"]
+        wanted = prodi.cat.categories.get_indexer(list(program))
+        # -1 marks unknown labels; drop them so they cannot match missing values (also code -1)
+        mask &= np.isin(prodi.cat.codes.to_numpy(), wanted[wanted >= 0])
+
+    # No active filter: reuse the frame as-is instead of copying rows
+    data = _df if mask.all() else _df[mask]
+    summary_cols = [col for col in SUMMARY_COLS if col in _df.columns]
+    views = {
+        "data": data,
+        "summary": data[summary_cols].rename(columns=SUMMARY_RENAME),
+        "stress": None,
+        "support": None,
+    }
+    if {"kategori_fomo", "indeks_stres"}.issubset(_df.columns):
+        views["stress"] = masked_group_mean(_df, mask, "kategori_fomo", "indeks_stres", "Indeks Stres Rata-rata")
+    if "kebutuhan_akan_dukungan_emosional_dan_bantuan_psikologis" in _df.columns:
+        views["support"] = masked_counts(
+            _df,
+            mask,
+            "kebutuhan_akan_dukungan_emosional_dan_bantuan_psikologis",
+            ["Kebutuhan Dukungan", "Responden"],
+        )
+    return views
+
+@st.cache_data(show_spinner=False)
+def agg_fak_proporsi(_df: pd.DataFrame) -> pd.DataFrame:
+    top_proporsi = (
+        _df.groupby("fakultas", observed=True)["proporsi_fomo"]
+        .mean()
+        .reset_index()
+        .sort_values("proporsi_fomo", ascending=False)
+        .head(5)
+    ).rename(columns={"fakultas": "Fakultas", "proporsi_fomo": "Proporsi FOMO"})
+    top_proporsi["Label"] = top_proporsi["Proporsi FOMO"].apply(lambda x: f"{x*100:,.1f}%")
+    return top_proporsi
+
+@st.cache_data(show_spinner=False)
+def agg_dukungan(_df: pd.DataFrame) -> pd.DataFrame:
+    return count_by(_df, ["fakultas", "kebutuhan_akan_dukungan_emosional_dan_bantuan_psikologis"], "Responden")
+
+@st.cache_data(show_spinner=False)
+def agg_treemap(_df: pd.DataFrame) -> pd.DataFrame:
+    return count_by(_df, ["fakultas", "program_studi"], "Responden")
+
+@st.cache_data(show_spinner=False)
+def agg_avg_spend(_df: pd.DataFrame) -> pd.DataFrame:
+    return (
+        _df.groupby("kategori_fomo", observed=True)["pengeluaran_untuk_fomo_per_bulan"]
+        .mean()
+        .reset_index()
+        .rename(
+            columns={
+                "kategori_fomo": "Kategori FOMO",
+                "pengeluaran_untuk_fomo_per_bulan": "Rata-rata Pengeluaran",
+            }
+        )
+    )
+
+@st.cache_data(show_spinner=False)
+def agg_crosstab(_df: pd.DataFrame) -> pd.DataFrame:
+    counts = (
+        _df.groupby(["kategori_fomo", "kategori_keuangan"], observed=True)
+        .size()
+        .unstack(fill_value=0)
+    )
+    return counts.div(counts.sum(axis=1), axis=0).mul(100.0)
+
+@st.cache_data(show_spinner=False)
+def agg_stress(_df: pd.DataFrame) -> pd.DataFrame:
+    return (
+        _df.groupby("kategori_keuangan", observed=True)["indeks_stres"]
+        .mean()
+        .reset_index(name="Indeks Stres Rata-rata")
+    )
+
+# Figur (di-cache sebagai resource; objek figur dipakai bersama antar rerun)
+@st.cache_resource(show_spinner=False)
+def fig_daily_line(daily: pd.DataFrame):
+    fig = px.line(
+        daily,
+        x="tanggal",
+        y="Jumlah Responden",
+        markers=True,
+        color_discrete_sequence=[SALMON],
+        title="Tren Jumlah Responden per Hari",
+    )
+    fig.update_layout(xaxis_title="Tanggal", yaxis_title="Jumlah Responden")
+    return style_plot(fig)
+
+@st.cache_resource(show_spinner=False)
+def fig_daily_cumulative(daily: pd.DataFrame):
+    fig = px.area(
+        daily,
+        x="tanggal",
+        y="Kumulatif Responden",
+        color_discrete_sequence=[SALMON],
+        title="Akumulasi Responden Selama Periode Survei",
+    )
+    fig.update_traces(
+        line=dict(color=SALMON),
+        fillcolor="rgba(250,128,114,0.25)",
+    )
+    fig.update_layout(xaxis_title="Tanggal", yaxis_title="Responden Kumulatif")
+    return style_plot(fig)
+
+@st.cache_resource(show_spinner=False)
+def fig_weekly_bar(weekly: pd.DataFrame):
+    fig = px.bar(
+        weekly,
+        x="minggu",
+        y="Responden",
+        text="Responden",
+        color_discrete_sequence=[SALMON],
+        title="Distribusi Responden per Minggu",
+    )
+    fig.update_traces(textposition="outside")
+    fig.update_layout(xaxis_title="Minggu (Periode)", yaxis_title="Jumlah Responden")
+    return style_plot(fig)
+
+@st.cache_resource(show_spinner=False)
+def fig_hari_jam_heatmap(heat: pd.DataFrame):
+    fig = px.density_heatmap(
+        heat,
+        x="jam",
+        y="hari",
+        z="Responden",
+        color_continuous_scale=GRADIENT,
+        title="Kepadatan Responden Berdasarkan Hari dan Jam",
+    )
+    fig.update_layout(xaxis_title="Jam", yaxis_title="Hari")
+    return style_plot(fig)
+
+@st.cache_resource(show_spinner=False)
+def fig_fakultas_bar(fak: pd.DataFrame):
+    fig = px.bar(
+        fak,
+        x="Jumlah",
+        y="Fakultas",
+        orientation="h",
+        color_discrete_sequence=[SKYBLUE],
+        text="Jumlah",
+        title="Distribusi Responden Berdasarkan Fakultas",
+    )
+    fig.update_layout(yaxis=dict(autorange="reversed"))
+    return style_plot(fig)
+
+@st.cache_resource(show_spinner=False)
+def fig_fak_proporsi_bar(top_proporsi: pd.DataFrame):
+    fig = px.bar(
+        top_proporsi,
+        x="Fakultas",
+        y="Proporsi FOMO",
+        color="Proporsi FOMO",
+        text="Label",
+        color_continuous_scale=GRADIENT,
+        title="Top 5 Fakultas dengan Proporsi Pengeluaran FOMO Tertinggi",
+    )
+    fig.update_layout(
+        xaxis_title="Fakultas", yaxis_title="Proporsi FOMO Rata-rata", uniformtext_minsize=10
+    )
+    return style_plot(fig)
+
+def outlier_points(name: str, outliers: tuple, color: str):
+    """Outlier markers for a box drawn from precomputed quartiles."""
+    return go.Scatter(
+        x=[name] * len(outliers),
+        y=list(outliers),
+        mode="markers",
+        marker=dict(color=color, size=5),
+        name=name,
+        showlegend=False,
+        hovertemplate=f"%{{y}}<extra>{name}</extra>",
+    )
+
+@st.cache_resource(show_spinner=False)
+def fig_fak_spend_box(box_stats: pd.DataFrame):
+    # Boxes are drawn from precomputed quartiles, so only a handful of numbers per fakultas are sent
+    fig = go.Figure(
+        [
+            go.Box(
+                x=[row.fakultas],
+                q1=[row.q1],
+                median=[row.median],
+                q3=[row.q3],
+                lowerfence=[row.lowerfence],
+                upperfence=[row.upperfence],
+                name=row.fakultas,
+                marker_color=GRADIENT[i % len(GRADIENT)],
+            )
+            for i, row in enumerate(box_stats.itertuples(index=False))
+        ]
+    )
+    # Only the points beyond the whiskers are sent, as with boxpoints="outliers"
+    for i, row in enumerate(box_stats.itertuples(index=False)):
+        if row.outliers:
+            fig.add_trace(outlier_points(row.fakultas, row.outliers, GRADIENT[i % len(GRADIENT)]))
+    fig.update_layout(
+        title="Sebaran Pengeluaran FOMO Bulanan per Fakultas",
+        xaxis_title="Fakultas",
+        yaxis_title="Pengeluaran FOMO per Bulan (Rp)",
+        showlegend=False,
+    )
+    return style_plot(fig)
+
+@st.cache_resource(show_spinner=False)
+def fig_dukungan_bar(dukungan: pd.DataFrame):
+    fig = px.bar(
+        dukungan,
+        x="fakultas",
+        y="Responden",
+        color="kebutuhan_akan_dukungan_emosional_dan_bantuan_psikologis",
+        color_discrete_map={"Ya": SALMON, "Tidak": SKYBLUE},
+        title="Kebutuhan Dukungan Emosional per Fakultas",
+        barmode="stack",
+    )
+    fig.update_layout(
+        xaxis_title="Fakultas", yaxis_title="Jumlah Responden", legend_title="Butuh Dukungan"
+    )
+    return style_plot(fig)
+
+@st.cache_resource(show_spinner=False)
+def fig_treemap(treemap_source: pd.DataFrame):
+    fig = px.treemap(
+        treemap_source,
+        path=["fakultas", "program_studi"],
+        values="Responden",
+        color="Responden",
+        color_continuous_scale=GRADIENT,
+        title="Pemetaan Responden per Fakultas dan Program Studi",
+    )
+    return style_plot(fig)
+
+@st.cache_resource(show_spinner=False)
+def fig_proporsi_pie(_df: pd.DataFrame):
+    fig = px.pie(
+        _df.dropna(subset=["kategori_proporsi"]),
+        names="kategori_proporsi",
+        title="Proporsi Pengeluaran FOMO dari Uang Saku",
+        color="kategori_proporsi",
+        color_discrete_map={
+            "Rendah (<20%)": "#FFE5E0",
+            "Sedang (20-50%)": "#FF8C75",
+            "Tinggi (>50%)": "#C94A44",
+        },
+    )
+    fig.update_traces(textinfo="percent+label")
+    return style_plot(fig)
+
+@st.cache_resource(show_spinner=False)
+def fig_avg_spend_bar(avg_spend: pd.DataFrame):
+    fig = px.bar(
+        avg_spend,
+        x="Kategori FOMO",
+        y="Rata-rata Pengeluaran",
+        color="Kategori FOMO",
+        text=avg_spend["Rata-rata Pengeluaran"].apply(lambda x: f"Rp {x:,.0f}"),
+        color_discrete_map={"Sering": SALMON, "Jarang": SKYBLUE},
+        title="Rata-rata Pengeluaran FOMO Berdasarkan Kategori FOMO",
+    )
+    fig.update_layout(showlegend=False, yaxis_title="Rata-rata Pengeluaran (Rp)")
+    return style_plot(fig)
+
+@st.cache_resource(show_spinner=False)
+def fig_budget_scatter(_df: pd.DataFrame):
+    fig = px.scatter(
+        _df,
+        x="rata-rata_uang_saku_perbulan",
+        y="pengeluaran_untuk_fomo_per_bulan",
+        size="pengeluaran_untuk_fomo_per_bulan",
+        color="kategori_fomo" if "kategori_fomo" in _df.columns else None,
+        color_discrete_map={"Sering": SALMON, "Jarang": SKYBLUE},
+        hover_data=["fakultas"] if "fakultas" in _df.columns else None,
+        title="Uang Saku vs Pengeluaran FOMO",
+    )
+    fig.update_layout(
+        xaxis_title="Rata-rata Uang Saku per Bulan (Rp)",
+        yaxis_title="Pengeluaran FOMO per Bulan (Rp)",
+    )
+    return style_plot(fig)
+
+@st.cache_resource(show_spinner=False)
+def fig_proporsi_violin(_df: pd.DataFrame):
+    fig = px.violin(
+        _df,
+        x="kategori_keuangan",
+        y="proporsi_fomo",
+        color="kategori_keuangan",
+        color_discrete_sequence=[SALMON, SKYBLUE, MINT],
+        box=True,
+        points="outliers",
+        title="Sebaran Proporsi FOMO berdasarkan Kategori Keuangan",
+    )
+    fig.update_layout(
+        xaxis_title="Kategori Keuangan",
+        yaxis_title="Proporsi Pengeluaran FOMO",
+        showlegend=False,
+    )
+    return style_plot(fig)
+
+@st.cache_resource(show_spinner=False)
+def fig_crosstab_heatmap(crosstab: pd.DataFrame):
+    fig = px.imshow(
+        crosstab,
+        text_auto=".1f",
+        color_continuous_scale=GRADIENT,
+        title="Heatmap FOMO vs Keuangan (Proporsi per Kategori FOMO)",
+    )
+    fig.update_layout(coloraxis_colorbar_title="%")
+    return style_plot(fig)
+
+@st.cache_resource(show_spinner=False)
+def fig_psikologis_box(box_stats: pd.DataFrame):
+    fig = go.Figure(
+        go.Box(
+            q1=box_stats["q1"],
+            median=box_stats["median"],
+            q3=box_stats["q3"],
+            lowerfence=box_stats["lowerfence"],
+            upperfence=box_stats["upperfence"],
+            name="Skor Psikologis",
+            marker_color=SALMON,
+        )
+    )
+    outliers = box_stats["outliers"].iloc[0]
+    if outliers:
+        fig.add_trace(outlier_points("Skor Psikologis", outliers, SALMON))
+    fig.update_layout(title="Distribusi Skor Psikologis Mahasiswa", yaxis_title="Skor Psikologis", showlegend=False)
+    return style_plot(fig)
+
+@st.cache_resource(show_spinner=False)
+def fig_psikologis_hist(_df: pd.DataFrame):
+    fig = px.histogram(
+        _df,
+        x="skor_psikologis",
+        nbins=15,
+        color_discrete_sequence=[SALMON],
+        title="Histogram Skor Psikologis",
+    )
+    fig.update_layout(xaxis_title="Skor Psikologis", yaxis_title="Jumlah Responden")
+    return style_plot(fig)
+
+@st.cache_resource(show_spinner=False)
+def fig_psikologis_violin(_df: pd.DataFrame):
+    fig = px.violin(
+        _df,
+        x="kategori_fomo",
+        y="skor_psikologis",
+        color="kategori_fomo",
+        color_discrete_map={"Sering": SALMON, "Jarang": SKYBLUE},
+        box=True,
+        points="outliers",
+        title="Skor Psikologis berdasarkan Kategori FOMO",
+    )
+    fig.update_layout(
+        xaxis_title="Kategori FOMO",
+        yaxis_title="Skor Psikologis",
+        showlegend=False,
+    )
+    return style_plot(fig)
+
+@st.cache_resource(show_spinner=False)
+def fig_stress_bar(stres_summary: pd.DataFrame):
+    fig = px.bar(
+        stres_summary,
+        x="kategori_keuangan",
+        y="Indeks Stres Rata-rata",
+        color="Indeks Stres Rata-rata",
+        color_continuous_scale=GRADIENT,
+        title="Rata-rata Indeks Stres per Kategori Keuangan",
+    )
+    fig.update_layout(xaxis_title="Kategori Keuangan", yaxis_title="Indeks Stres Rata-rata")
+    return style_plot(fig)
+
+@st.cache_resource(show_spinner=False)
+def fig_proporsi_psikologis_scatter(_df: pd.DataFrame, trendlines: pd.DataFrame):
+    fig = px.scatter(
+        _df,
+        x="proporsi_fomo",
+        y="skor_psikologis",
+        color="kategori_fomo" if "kategori_fomo" in _df.columns else None,
+        color_discrete_map={"Sering": SALMON, "Jarang": SKYBLUE},
+        hover_data=["fakultas"] if "fakultas" in _df.columns else None,
+        title="Proporsi Pengeluaran FOMO vs Skor Psikologis",
+    )
+    line_colors = {"Sering": SALMON, "Jarang": SKYBLUE}
+    for row in trendlines.itertuples(index=False):
+        fig.add_scatter(
+            x=[row.x0, row.x1],
+            y=[row.slope * row.x0 + row.intercept, row.slope * row.x1 + row.intercept],
+            mode="lines",
+            name=str(row.group),
+            legendgroup=str(row.group),
+            showlegend=False,
+            line=dict(color=line_colors.get(row.group, SALMON)),
+            hovertemplate=(
+                f"<b>OLS trendline</b><br>skor_psikologis = {row.slope:.6g} * proporsi_fomo + {row.intercept:.6g}"
+                f"<br>R<sup>2</sup>={row.r2:.6f}<extra>{row.group}</extra>"
+            ),
+        )
+    fig.update_layout(
+        xaxis_tickformat="%",
+        xaxis_title="Proporsi Pengeluaran FOMO",
+        yaxis_title="Skor Psikologis",
+    )
+    return style_plot(fig)
+
+@st.cache_resource(show_spinner=False)
+def fig_density_contour(_df: pd.DataFrame):
+    fig = px.density_contour(
+        _df,
+        x="kemampuan_mengelola_keuangan",
+        y="skor_psikologis",
+        color="kategori_fomo" if "kategori_fomo" in _df.columns else None,
+        color_discrete_map={"Sering": SALMON, "Jarang": SKYBLUE},
+        title="Kepadatan Skor Keuangan dan Psikologis",
+    )
+    fig.update_layout(
+        xaxis_title="Kemampuan Mengelola Keuangan",
+        yaxis_title="Skor Psikologis",
+    )
+    return style_plot(fig)
+
+def compact_coords(values: np.ndarray) -> np.ndarray:
+    """Integer-valued coordinates as int16 (half the bytes of float32, still exact); anything else unchanged."""
+    if (
+        values.dtype.kind == "f"
+        and len(values)
+        and np.isfinite(values).all()
+        and np.abs(values).max() < 2**15
+        and (values == np.round(values)).all()
+    ):
+        return values.astype("int16")
+    return values
+
+def scatter_traces(data: pd.DataFrame, x: str, y: str, group: Optional[str], colors: dict, render_mode: str = "auto") -> list:
+    """Scatter traces per category from NumPy slices; on the WebGL path all points share one trace."""
+    trace = go.Scattergl if render_mode == "webgl" else go.Scatter
+    xs = data[x].to_numpy()
+    ys = data[y].to_numpy()
+    if render_mode == "webgl":
+        # Many points: ship whole-number scores to the browser as int16
+        xs, ys = compact_coords(xs), compact_coords(ys)
+    hover = f"{x}=%{{x}}<br>{y}=%{{y}}<extra>%{{fullData.name}}</extra>"
+    if group is None:
+        return [trace(x=xs, y=ys, mode="markers", marker_color=SALMON, hovertemplate=hover, showlegend=False)]
+    codes = data[group].cat.codes.to_numpy()
+    categories = data[group].cat.categories
+    if render_mode == "webgl":
+        # One trace for all points, coloured per point by category code
+        palette = [colors.get(category, SALMON) for category in categories]
+        k = len(palette)
+        colorscale = [[bound, color] for i, color in enumerate(palette) for bound in (i / k, (i + 1) / k)]
+        drawn = codes >= 0
+        traces = [
+            trace(
+                x=xs[drawn],
+                y=ys[drawn],
+                mode="markers",
+                marker=dict(color=codes[drawn], colorscale=colorscale, cmin=-0.5, cmax=k - 0.5),
+                hovertemplate=f"{x}=%{{x}}<br>{y}=%{{y}}<extra></extra>",
+                showlegend=False,
+            )
+        ]
+        # Legend-only entries without points
+        for code, category in enumerate(categories):
+            if (codes == code).any():
+                traces.append(
+                    trace(
+                        x=[None],
+                        y=[None],
+                        mode="markers",
+                        name=str(category),
+                        legendgroup=str(category),
+                        marker_color=palette[code],
+                    )
+                )
+        return traces
+    traces = []
+    for code, category in enumerate(categories):
+        selected = codes == code
+        if not selected.any():
+            continue
+        traces.append(
+            trace(
+                x=xs[selected],
+                y=ys[selected],
+                mode="markers",
+                name=str(category),
+                legendgroup=str(category),
+                marker_color=colors.get(category, SALMON),
+                hovertemplate=hover,
+            )
+        )
+    return traces
+
+@st.cache_resource(show_spinner=False, max_entries=EXPLORE_CACHE_ENTRIES)
+def fig_explore_scatters(filters: tuple, panels: tuple, _data: pd.DataFrame):
+    """Eksplorasi scatter panels side by side in one figure, so the browser sets up one plot instead of two."""
+    render_mode = "webgl" if len(_data) > WEBGL_MIN_POINTS else "auto"
+    fig = make_subplots(rows=1, cols=len(panels), subplot_titles=[panel[3] for panel in panels])
+    for col, (x, group, colors, _, xaxis_title) in enumerate(panels, start=1):
+        # Each panel gets its own legend under its axis
+        legend = "legend" if col == 1 else f"legend{col}"
+        for trace in scatter_traces(_data, x, "skor_psikologis", group, colors, render_mode):
+            trace.legend = legend
+            fig.add_trace(trace, row=1, col=col)
+        fig.update_xaxes(title_text=xaxis_title, row=1, col=col)
+        fig.update_yaxes(title_text="Skor Psikologis", row=1, col=col)
+        x_start = fig.get_subplot(1, col).xaxis.domain[0]
+        legend_style = dict(title_text=group, orientation="h", x=x_start, xanchor="left", y=-0.25, yanchor="top")
+        if render_mode == "webgl":
+            # Points share one merged trace, so legend entries are labels only and cannot toggle categories
+            legend_style.update(itemclick=False, itemdoubleclick=False)
+        fig.update_layout({legend: legend_style})
+    fig.update_annotations(font=dict(color=SALMON, size=16))
+    style_plot(fig)
+    # Room under the axes for the per-panel legends
+    fig.update_layout(margin=dict(b=120))
+    return fig
+
+@st.cache_resource(show_spinner=False, max_entries=EXPLORE_CACHE_ENTRIES)
+def fig_explore_stress_bar(filters: tuple, _stress: pd.DataFrame):
+    fomo_colors = {"Sering": SALMON, "Jarang": SKYBLUE}
+    categories = _stress["kategori_fomo"].to_numpy()
+    fig = go.Figure(
+        go.Bar(
+            x=categories,
+            y=_stress["Indeks Stres Rata-rata"].to_numpy(),
+            marker_color=[fomo_colors.get(c, SALMON) for c in categories],
+            hovertemplate="kategori_fomo=%{x}<br>Indeks Stres Rata-rata=%{y}<extra></extra>",
+        )
+    )
+    fig.update_layout(
+        title="Indeks Stres Rata-rata per Kategori FOMO (Filter Aktif)",
+        xaxis_title="Kategori FOMO",
+        yaxis_title="Indeks Stres Rata-rata",
+        showlegend=False,
+    )
+    return style_plot(fig)
+
+@st.cache_resource(show_spinner=False, max_entries=EXPLORE_CACHE_ENTRIES)
+def fig_explore_support_pie(filters: tuple, _support: pd.DataFrame):
+    support_colors = {"Ya": SALMON, "Tidak": SKYBLUE}
+    labels = _support["Kebutuhan Dukungan"].to_numpy()
+    fig = go.Figure(
+        go.Pie(
+            labels=labels,
+            values=_support["Responden"].to_numpy(),
+            marker_colors=[support_colors.get(label, MINT) for label in labels],
+            hovertemplate="Kebutuhan Dukungan=%{label}<br>Responden=%{value}<extra></extra>",
+        )
+    )
+    fig.update_layout(
+        title="Proporsi Kebutuhan Dukungan Emosional (Filter Aktif)",
+        legend_title_text="Kebutuhan Dukungan",
+    )
+    return style_plot(fig)
+
 load_local_css()
 
 # Sidebar Navigasi
@@ -188,45 +1031,15 @@ for page in pages:
         disabled=st.session_state["page"] == page,
     )
 
-menu = st.session_state["page"]
-
 # Halaman 1: Pendahuluan
-if menu == "Pendahuluan":
+@st.fragment
+def page_pendahuluan() -> None:
     render_banner(
         "Pendahuluan",
         "Ringkasan proyek analisis FOMO mahasiswa dan gambaran struktur dataset yang digunakan."
     )
 
-    st.markdown(
-        """
-        <div class="card">
-            <h2>Gambaran Proyek</h2>
-            <p>
-                Dashboard ini merangkum hasil survei mengenai fenomena <em>Fear of Missing Out</em> (FOMO)
-                di kalangan mahasiswa. Fokus utamanya adalah menggali hubungan antara tekanan sosial,
-                perilaku konsumtif, dan kondisi kesejahteraan psikologis.
-            </p>
-            <p>
-                Data yang dianalisis mencakup 153 responden lintas fakultas di UPN Veteran Jawa Timur.
-                Survei menyoroti seberapa sering mahasiswa mengalami FOMO, besaran alokasi pengeluaran
-                yang terdorong oleh FOMO, hingga kemampuan mereka mengelola keuangan pribadi.
-            </p>
-            <h3>Struktur Dataset</h3>
-            <ul>
-                <li><strong>Identitas:</strong> timestamp, fakultas, program studi.</li>
-                <li><strong>FOMO &amp; Emosi:</strong> frekuensi FOMO, pengaruh terhadap emosi, indeks stres.</li>
-                <li><strong>Keuangan:</strong> uang saku bulanan, pengeluaran karena FOMO, kemampuan mengelola keuangan.</li>
-                <li><strong>Kesejahteraan:</strong> skor psikologis, kebutuhan dukungan emosional.</li>
-            </ul>
-            <p>
-                Dengan menggabungkan visualisasi interaktif dan ringkasan statistik,
-                dashboard ini diharapkan mampu menjadi referensi untuk merancang program pendampingan
-                maupun kebijakan peningkatan literasi finansial dan kesehatan mental mahasiswa.
-            </p>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(PENDAHULUAN_HTML, unsafe_allow_html=True)
 
     col1, col2, col3, col4 = st.columns(4)
     col1.metric("Total Responden", f"{len(df):,}")
@@ -255,487 +1068,207 @@ if menu == "Pendahuluan":
             f"Periode survei: {df['timestamp'].dropna().min().date()} - {df['timestamp'].dropna().max().date()}"
         )
 
-elif menu == "Analisis & Visualisasi":
-    render_banner(
-        "Analisis & Visualisasi",
-        "Eksplorasi statistik utama terkait distribusi responden, perilaku FOMO, dan kesejahteraan mahasiswa."
-    )
-    tab1, tab2, tab3, tab4 = st.tabs(
-        ["Responden Harian", "Fakultas", "FOMO dan Keuangan", "Psikologis"]
-    )
+# Halaman 2: Analisis & Visualisasi
+@st.fragment
+def tab_daily() -> None:
+    st.subheader("Tren Jumlah Responden Harian")
+    if "timestamp" in df.columns:
+        daily = agg_daily(df)
+        col_ts_1, col_ts_2 = st.columns(2)
+        with col_ts_1:
+            show_plot(fig_daily_line(daily))
 
-    # Tab 1
-    with tab1:
-        st.subheader("Tren Jumlah Responden Harian")
-        if "timestamp" in df.columns:
-            data_ts = df.dropna(subset=["timestamp"]).copy()
-            data_ts["tanggal"] = data_ts["timestamp"].dt.date
-            daily = (
-                data_ts.groupby("tanggal")
-                .size()
-                .reset_index(name="Jumlah Responden")
-                .sort_values("tanggal")
-            )
-            col_ts_1, col_ts_2 = st.columns(2)
-            with col_ts_1:
-                fig = px.line(
-                    daily,
-                    x="tanggal",
-                    y="Jumlah Responden",
-                    markers=True,
-                    color_discrete_sequence=[SALMON],
-                    title="Tren Jumlah Responden per Hari",
-                )
-                fig.update_layout(xaxis_title="Tanggal", yaxis_title="Jumlah Responden")
-                render_plot(fig)
-
-            with col_ts_2:
-                daily["Kumulatif Responden"] = daily["Jumlah Responden"].cumsum()
-                fig_cum = px.area(
-                    daily,
-                    x="tanggal",
-                    y="Kumulatif Responden",
-                    color_discrete_sequence=[SALMON],
-                    title="Akumulasi Responden Selama Periode Survei",
-                )
-                fig_cum.update_traces(
-                    line=dict(color=SALMON),
-                    fillcolor="rgba(250,128,114,0.25)",
-                )
-                fig_cum.update_layout(xaxis_title="Tanggal", yaxis_title="Responden Kumulatif")
-                render_plot(fig_cum)
-
-            weekly = (
-                data_ts.assign(minggu=data_ts["timestamp"].dt.to_period("W").astype(str))
-                .groupby("minggu")
-                .size()
-                .reset_index(name="Responden")
-            )
-            col_ts_3, col_ts_4 = st.columns(2)
-            with col_ts_3:
-                fig_week = px.bar(
-                    weekly,
-                    x="minggu",
-                    y="Responden",
-                    text="Responden",
-                    color_discrete_sequence=[SALMON],
-                    title="Distribusi Responden per Minggu",
-                )
-                fig_week.update_traces(textposition="outside")
-                fig_week.update_layout(xaxis_title="Minggu (Periode)", yaxis_title="Jumlah Responden")
-                render_plot(fig_week)
-
-            with col_ts_4:
-                if {"hari", "jam"}.issubset(data_ts.columns):
-                    order_hari = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-                    heat = (
-                        data_ts.groupby(["hari", "jam"])
-                        .size()
-                        .reset_index(name="Responden")
-                    )
-                    heat["hari"] = pd.Categorical(heat["hari"], categories=order_hari, ordered=True)
-                    heat = heat.sort_values(["hari", "jam"])
-                    fig_heat = px.density_heatmap(
-                        heat,
-                        x="jam",
-                        y="hari",
-                        z="Responden",
-                        color_continuous_scale=GRADIENT,
-                        title="Kepadatan Responden Berdasarkan Hari dan Jam",
-                    )
-                    fig_heat.update_layout(xaxis_title="Jam", yaxis_title="Hari")
-                    render_plot(fig_heat)
-                else:
-                    st.info("Data jam responden belum tersedia untuk heatmap.")
-        else:
-            st.warning("Kolom 'timestamp' tidak ditemukan.")
+        with col_ts_2:
+            show_plot(fig_daily_cumulative(daily))
 
-    # Tab 2
-    with tab2:
-        st.subheader("Distribusi Responden per Fakultas")
-        if "fakultas" in df.columns:
-            fak = (
-                df.groupby("fakultas")
-                .size()
-                .reset_index(name="Jumlah")
-                .sort_values("Jumlah", ascending=True)
-            ).rename(columns={"fakultas": "Fakultas"})
-            col_fac_top = st.columns(2)
-            with col_fac_top[0]:
-                fig = px.bar(
-                    fak,
-                    x="Jumlah",
-                    y="Fakultas",
-                    orientation="h",
-                    color_discrete_sequence=[SKYBLUE],
-                    text="Jumlah",
-                    title="Distribusi Responden Berdasarkan Fakultas",
-                )
-                fig.update_layout(yaxis=dict(autorange="reversed"))
-                render_plot(fig)
-
-            with col_fac_top[1]:
-                if "proporsi_fomo" in df.columns and df["proporsi_fomo"].notna().any():
-                    top_proporsi = (
-                        df.groupby("fakultas")["proporsi_fomo"]
-                        .mean()
-                        .reset_index()
-                        .sort_values("proporsi_fomo", ascending=False)
-                        .head(5)
-                    ).rename(columns={"fakultas": "Fakultas", "proporsi_fomo": "Proporsi FOMO"})
-                    top_proporsi["Label"] = top_proporsi["Proporsi FOMO"].apply(lambda x: f"{x*100:,.1f}%")
-                    fig_prop = px.bar(
-                        top_proporsi,
-                        x="Fakultas",
-                        y="Proporsi FOMO",
-                        color="Proporsi FOMO",
-                        text="Label",
-                        color_continuous_scale=GRADIENT,
-                        title="Top 5 Fakultas dengan Proporsi Pengeluaran FOMO Tertinggi",
-                    )
-                    fig_prop.update_layout(
-                        xaxis_title="Fakultas", yaxis_title="Proporsi FOMO Rata-rata", uniformtext_minsize=10
-                    )
-                    render_plot(fig_prop)
-                else:
-                    st.info("Data proporsi pengeluaran FOMO belum tersedia.")
-
-            col_fac_bottom = st.columns(2)
-            with col_fac_bottom[0]:
-                if {"fakultas", "pengeluaran_untuk_fomo_per_bulan"}.issubset(df.columns):
-                    box_data = df.dropna(subset=["fakultas", "pengeluaran_untuk_fomo_per_bulan"])
-                    if not box_data.empty:
-                        fig_box = px.box(
-                            box_data,
-                            x="fakultas",
-                            y="pengeluaran_untuk_fomo_per_bulan",
-                            points="all",
-                            title="Sebaran Pengeluaran FOMO Bulanan per Fakultas",
-                            color="fakultas",
-                            color_discrete_sequence=GRADIENT,
-                        )
-                        fig_box.update_layout(
-                            xaxis_title="Fakultas", yaxis_title="Pengeluaran FOMO per Bulan (Rp)", showlegend=False
-                        )
-                        render_plot(fig_box)
-                    else:
-                        st.info("Data pengeluaran FOMO per fakultas belum tersedia.")
-                else:
-                    st.info("Kolom pengeluaran FOMO belum tersedia.")
-
-            with col_fac_bottom[1]:
-                if {"fakultas", "kebutuhan_akan_dukungan_emosional_dan_bantuan_psikologis"}.issubset(df.columns):
-                    dukungan = (
-                        df.groupby(["fakultas", "kebutuhan_akan_dukungan_emosional_dan_bantuan_psikologis"])
-                        .size()
-                        .reset_index(name="Responden")
-                    )
-                    if not dukungan.empty:
-                        fig_support = px.bar(
-                            dukungan,
-                            x="fakultas",
-                            y="Responden",
-                            color="kebutuhan_akan_dukungan_emosional_dan_bantuan_psikologis",
-                            color_discrete_map={"Ya": SALMON, "Tidak": SKYBLUE},
-                            title="Kebutuhan Dukungan Emosional per Fakultas",
-                            barmode="stack",
-                        )
-                        fig_support.update_layout(
-                            xaxis_title="Fakultas", yaxis_title="Jumlah Responden", legend_title="Butuh Dukungan"
-                        )
-                        render_plot(fig_support)
-                    else:
-                        st.info("Data kebutuhan dukungan emosional belum tersedia.")
+        weekly = agg_weekly(df)
+        col_ts_3, col_ts_4 = st.columns(2)
+        with col_ts_3:
+            show_plot(fig_weekly_bar(weekly))
+
+        with col_ts_4:
+            if {"hari", "jam"}.issubset(df.columns):
+                show_plot(fig_hari_jam_heatmap(agg_hari_jam(df)))
+            else:
+                st.info("Data jam responden belum tersedia untuk heatmap.")
+    else:
+        st.warning("Kolom 'timestamp' tidak ditemukan.")
+
+@st.fragment
+def tab_fakultas() -> None:
+    st.subheader("Distribusi Responden per Fakultas")
+    if "fakultas" in df.columns:
+        col_fac_top = st.columns(2)
+        with col_fac_top[0]:
+            show_plot(fig_fakultas_bar(agg_fakultas(df)))
+
+        with col_fac_top[1]:
+            if "proporsi_fomo" in df.columns and df["proporsi_fomo"].notna().any():
+                show_plot(fig_fak_proporsi_bar(agg_fak_proporsi(df)))
+            else:
+                st.info("Data proporsi pengeluaran FOMO belum tersedia.")
+
+        col_fac_bottom = st.columns(2)
+        with col_fac_bottom[0]:
+            if {"fakultas", "pengeluaran_untuk_fomo_per_bulan"}.issubset(df.columns):
+                box_stats = agg_box(df, "pengeluaran_untuk_fomo_per_bulan", "fakultas")
+                if not box_stats.empty:
+                    show_plot(fig_fak_spend_box(box_stats))
                 else:
-                    st.info("Kolom kebutuhan dukungan emosional belum tersedia.")
-
-            if "program_studi" in df.columns:
-                st.caption("Klik pada visualisasi untuk memperbesar rincian per program studi.")
-                treemap_source = (
-                    df.groupby(["fakultas", "program_studi"])
-                    .size()
-                    .reset_index(name="Responden")
-                )
-                if not treemap_source.empty:
-                    fig_tree = px.treemap(
-                        treemap_source,
-                        path=["fakultas", "program_studi"],
-                        values="Responden",
-                        color="Responden",
-                        color_continuous_scale=GRADIENT,
-                        title="Pemetaan Responden per Fakultas dan Program Studi",
-                    )
-                    render_plot(fig_tree)
+                    st.info("Data pengeluaran FOMO per fakultas belum tersedia.")
+            else:
+                st.info("Kolom pengeluaran FOMO belum tersedia.")
+
+        with col_fac_bottom[1]:
+            if {"fakultas", "kebutuhan_akan_dukungan_emosional_dan_bantuan_psikologis"}.issubset(df.columns):
+                dukungan = agg_dukungan(df)
+                if not dukungan.empty:
+                    show_plot(fig_dukungan_bar(dukungan))
                 else:
-                    st.info("Data program studi belum tersedia.")
-        else:
-            st.warning("Kolom 'fakultas' tidak tersedia.")
+                    st.info("Data kebutuhan dukungan emosional belum tersedia.")
+            else:
+                st.info("Kolom kebutuhan dukungan emosional belum tersedia.")
 
-    # Tab 3
-    with tab3:
-        st.subheader("Proporsi Pengeluaran FOMO dari Uang Saku")
-        row_fomo_top = st.columns(2)
-        with row_fomo_top[0]:
-            if "kategori_proporsi" in df.columns and df["kategori_proporsi"].notna().any():
-                pie_source = df.dropna(subset=["kategori_proporsi"])
-                fig = px.pie(
-                    pie_source,
-                    names="kategori_proporsi",
-                    title="Proporsi Pengeluaran FOMO dari Uang Saku",
-                    color="kategori_proporsi",
-                    color_discrete_map={
-                        "Rendah (<20%)": "#FFE5E0",
-                        "Sedang (20-50%)": "#FF8C75",
-                        "Tinggi (>50%)": "#C94A44",
-                    },
-                )
-                fig.update_traces(textinfo="percent+label")
-                render_plot(fig)
+        if "program_studi" in df.columns:
+            st.caption("Klik pada visualisasi untuk memperbesar rincian per program studi.")
+            treemap_source = agg_treemap(df)
+            if not treemap_source.empty:
+                show_plot(fig_treemap(treemap_source))
             else:
-                st.info("Data kategori proporsi FOMO belum tersedia.")
-
-        with row_fomo_top[1]:
-            if {"kategori_fomo", "pengeluaran_untuk_fomo_per_bulan"}.issubset(df.columns):
-                avg_spend = (
-                    df.groupby("kategori_fomo")["pengeluaran_untuk_fomo_per_bulan"]
-                    .mean()
-                    .reset_index()
-                    .rename(
-                        columns={
-                            "kategori_fomo": "Kategori FOMO",
-                            "pengeluaran_untuk_fomo_per_bulan": "Rata-rata Pengeluaran",
-                        }
-                    )
-                )
-                fig_avg_spend = px.bar(
-                    avg_spend,
-                    x="Kategori FOMO",
-                    y="Rata-rata Pengeluaran",
-                    color="Kategori FOMO",
-                    text=avg_spend["Rata-rata Pengeluaran"].apply(lambda x: f"Rp {x:,.0f}"),
-                    color_discrete_map={"Sering": SALMON, "Jarang": SKYBLUE},
-                    title="Rata-rata Pengeluaran FOMO Berdasarkan Kategori FOMO",
-                )
-                fig_avg_spend.update_layout(showlegend=False, yaxis_title="Rata-rata Pengeluaran (Rp)")
-                render_plot(fig_avg_spend)
+                st.info("Data program studi belum tersedia.")
+    else:
+        st.warning("Kolom 'fakultas' tidak tersedia.")
+
+@st.fragment
+def tab_fomo_keuangan() -> None:
+    st.subheader("Proporsi Pengeluaran FOMO dari Uang Saku")
+    row_fomo_top = st.columns(2)
+    with row_fomo_top[0]:
+        if "kategori_proporsi" in df.columns and df["kategori_proporsi"].notna().any():
+            show_plot(fig_proporsi_pie(df))
+        else:
+            st.info("Data kategori proporsi FOMO belum tersedia.")
+
+    with row_fomo_top[1]:
+        if {"kategori_fomo", "pengeluaran_untuk_fomo_per_bulan"}.issubset(df.columns):
+            show_plot(fig_avg_spend_bar(agg_avg_spend(df)))
+        else:
+            st.info("Data kategori FOMO belum lengkap untuk perbandingan pengeluaran.")
+
+    row_fomo_bottom = st.columns(2)
+    with row_fomo_bottom[0]:
+        if {"rata-rata_uang_saku_perbulan", "pengeluaran_untuk_fomo_per_bulan"}.issubset(df.columns):
+            show_plot(fig_budget_scatter(df))
+        else:
+            st.info("Kolom uang saku dan pengeluaran FOMO diperlukan untuk scatter plot.")
+
+    with row_fomo_bottom[1]:
+        if {"kategori_keuangan", "proporsi_fomo"}.issubset(df.columns):
+            show_plot(fig_proporsi_violin(df))
+        else:
+            st.info("Data proporsi FOMO dan kategori keuangan dibutuhkan untuk violin plot.")
+
+    st.markdown("---")
+    st.subheader("Hubungan FOMO dan Kemampuan Keuangan")
+    if {"kategori_fomo", "kategori_keuangan"}.issubset(df.columns):
+        show_plot(fig_crosstab_heatmap(agg_crosstab(df)))
+    else:
+        st.info("Diperlukan data kategori FOMO dan keuangan untuk menampilkan heatmap.")
+
+@st.fragment
+def tab_psikologis() -> None:
+    st.subheader("Distribusi Skor Psikologis Mahasiswa")
+    if "skor_psikologis" in df.columns:
+        psy_row_top = st.columns(2)
+        with psy_row_top[0]:
+            box_stats = agg_box(df, "skor_psikologis")
+            if not box_stats.empty:
+                show_plot(fig_psikologis_box(box_stats))
             else:
-                st.info("Data kategori FOMO belum lengkap untuk perbandingan pengeluaran.")
-
-        row_fomo_bottom = st.columns(2)
-        with row_fomo_bottom[0]:
-            if {"rata-rata_uang_saku_perbulan", "pengeluaran_untuk_fomo_per_bulan"}.issubset(df.columns):
-                scatter_budget = px.scatter(
-                    df,
-                    x="rata-rata_uang_saku_perbulan",
-                    y="pengeluaran_untuk_fomo_per_bulan",
-                    size="pengeluaran_untuk_fomo_per_bulan",
-                    color="kategori_fomo" if "kategori_fomo" in df.columns else None,
-                    color_discrete_map={"Sering": SALMON, "Jarang": SKYBLUE},
-                    hover_data=["fakultas"] if "fakultas" in df.columns else None,
-                    title="Uang Saku vs Pengeluaran FOMO",
-                )
-                scatter_budget.update_layout(
-                    xaxis_title="Rata-rata Uang Saku per Bulan (Rp)",
-                    yaxis_title="Pengeluaran FOMO per Bulan (Rp)",
-                )
-                render_plot(scatter_budget)
+                st.info("Data skor psikologis belum tersedia.")
+
+        with psy_row_top[1]:
+            show_plot(fig_psikologis_hist(df))
+
+        psy_row_bottom = st.columns(2)
+        with psy_row_bottom[0]:
+            if "kategori_fomo" in df.columns:
+                show_plot(fig_psikologis_violin(df))
             else:
-                st.info("Kolom uang saku dan pengeluaran FOMO diperlukan untuk scatter plot.")
-
-        with row_fomo_bottom[1]:
-            if {"kategori_keuangan", "proporsi_fomo"}.issubset(df.columns):
-                violin_prop = px.violin(
-                    df,
-                    x="kategori_keuangan",
-                    y="proporsi_fomo",
-                    color="kategori_keuangan",
-                    color_discrete_sequence=[SALMON, SKYBLUE, MINT],
-                    box=True,
-                    points="all",
-                    title="Sebaran Proporsi FOMO berdasarkan Kategori Keuangan",
-                )
-                violin_prop.update_layout(
-                    xaxis_title="Kategori Keuangan",
-                    yaxis_title="Proporsi Pengeluaran FOMO",
-                    showlegend=False,
-                )
-                render_plot(violin_prop)
+                st.info("Kategori FOMO belum tersedia untuk perbandingan skor psikologis.")
+
+        with psy_row_bottom[1]:
+            if {"indeks_stres", "kategori_keuangan"}.issubset(df.columns) and df["indeks_stres"].notna().any():
+                stres_summary = agg_stress(df)
+                if not stres_summary.empty:
+                    show_plot(fig_stress_bar(stres_summary))
+                else:
+                    st.info("Indeks stres belum dapat dihitung.")
             else:
-                st.info("Data proporsi FOMO dan kategori keuangan dibutuhkan untuk violin plot.")
-
-        st.markdown("---")
-        st.subheader("Hubungan FOMO dan Kemampuan Keuangan")
-        if {"kategori_fomo", "kategori_keuangan"}.issubset(df.columns):
-            crosstab = pd.crosstab(
-                df["kategori_fomo"],
-                df["kategori_keuangan"],
-                normalize="index",
-            ) * 100
-            fig = px.imshow(
-                crosstab,
-                text_auto=".1f",
-                color_continuous_scale=GRADIENT,
-                title="Heatmap FOMO vs Keuangan (Proporsi per Kategori FOMO)",
-            )
-            fig.update_layout(coloraxis_colorbar_title="%")
-            render_plot(fig)
+                st.info("Perlu data indeks stres dan kategori keuangan.")
+
+    st.markdown("---")
+    st.subheader("Korelasi Antar Variabel Psikologis dan Keuangan")
+    rel_row = st.columns(2)
+    with rel_row[0]:
+        if {"proporsi_fomo", "skor_psikologis"}.issubset(df.columns):
+            group_col = "kategori_fomo" if "kategori_fomo" in df.columns else None
+            trendlines = agg_trendlines(df, "proporsi_fomo", "skor_psikologis", group_col)
+            show_plot(fig_proporsi_psikologis_scatter(df, trendlines))
+        else:
+            st.info("Data proporsi FOMO dan skor psikologis belum lengkap.")
+
+    with rel_row[1]:
+        if {"skor_psikologis", "kemampuan_mengelola_keuangan"}.issubset(df.columns):
+            show_plot(fig_density_contour(df))
         else:
-            st.info("Diperlukan data kategori FOMO dan keuangan untuk menampilkan heatmap.")
+            st.info("Data kemampuan keuangan dan skor psikologis dibutuhkan untuk kontur kepadatan.")
 
-    # Tab 4
+def page_analisis() -> None:
+    render_banner(
+        "Analisis & Visualisasi",
+        "Eksplorasi statistik utama terkait distribusi responden, perilaku FOMO, dan kesejahteraan mahasiswa."
+    )
+    tab1, tab2, tab3, tab4 = st.tabs(
+        ["Responden Harian", "Fakultas", "FOMO dan Keuangan", "Psikologis"]
+    )
+    with tab1:
+        tab_daily()
+    with tab2:
+        tab_fakultas()
+    with tab3:
+        tab_fomo_keuangan()
     with tab4:
-        st.subheader("Distribusi Skor Psikologis Mahasiswa")
-        if "skor_psikologis" in df.columns:
-            psy_row_top = st.columns(2)
-            with psy_row_top[0]:
-                fig = px.box(
-                    df,
-                    y="skor_psikologis",
-                    points="all",
-                    color_discrete_sequence=[SALMON],
-                    title="Distribusi Skor Psikologis Mahasiswa",
-                )
-                render_plot(fig)
-
-            with psy_row_top[1]:
-                hist = px.histogram(
-                    df,
-                    x="skor_psikologis",
-                    nbins=15,
-                    color_discrete_sequence=[SALMON],
-                    title="Histogram Skor Psikologis",
-                )
-                hist.update_layout(xaxis_title="Skor Psikologis", yaxis_title="Jumlah Responden")
-                render_plot(hist)
-
-            psy_row_bottom = st.columns(2)
-            with psy_row_bottom[0]:
-                if "kategori_fomo" in df.columns:
-                    violin_psy = px.violin(
-                        df,
-                        x="kategori_fomo",
-                        y="skor_psikologis",
-                        color="kategori_fomo",
-                        color_discrete_map={"Sering": SALMON, "Jarang": SKYBLUE},
-                        box=True,
-                        points="all",
-                        title="Skor Psikologis berdasarkan Kategori FOMO",
-                    )
-                    violin_psy.update_layout(
-                        xaxis_title="Kategori FOMO",
-                        yaxis_title="Skor Psikologis",
-                        showlegend=False,
-                    )
-                    render_plot(violin_psy)
-                else:
-                    st.info("Kategori FOMO belum tersedia untuk perbandingan skor psikologis.")
-
-            with psy_row_bottom[1]:
-                if {"indeks_stres", "kategori_keuangan"}.issubset(df.columns) and df["indeks_stres"].notna().any():
-                    stres_summary = (
-                        df.groupby("kategori_keuangan")["indeks_stres"]
-                        .mean()
-                        .reset_index(name="Indeks Stres Rata-rata")
-                    )
-                    if not stres_summary.empty:
-                        fig_stress = px.bar(
-                            stres_summary,
-                            x="kategori_keuangan",
-                            y="Indeks Stres Rata-rata",
-                            color="Indeks Stres Rata-rata",
-                            color_continuous_scale=GRADIENT,
-                            title="Rata-rata Indeks Stres per Kategori Keuangan",
-                        )
-                        fig_stress.update_layout(xaxis_title="Kategori Keuangan", yaxis_title="Indeks Stres Rata-rata")
-                        render_plot(fig_stress)
-                    else:
-                        st.info("Indeks stres belum dapat dihitung.")
-                else:
-                    st.info("Perlu data indeks stres dan kategori keuangan.")
-
-        st.markdown("---")
-        st.subheader("Korelasi Antar Variabel Psikologis dan Keuangan")
-        cols = [
-            "kemampuan_mengelola_keuangan",
-            "pengaruh_fomo_terhadap_emosi",
-            "frekuensi_stres_karena_finansial",
-            "frekuensi_hilang_semangat_kuliah_karena_tekanan_finansial",
-            "frekuensi_stres_fomo",
-            "skor_psikologis",
-        ]
-        rel_row = st.columns(2)
-        with rel_row[0]:
-            if {"proporsi_fomo", "skor_psikologis"}.issubset(df.columns):
-                scatter = px.scatter(
-                    df,
-                    x="proporsi_fomo",
-                    y="skor_psikologis",
-                    color="kategori_fomo" if "kategori_fomo" in df.columns else None,
-                    color_discrete_map={"Sering": SALMON, "Jarang": SKYBLUE},
-                    hover_data=["fakultas"] if "fakultas" in df.columns else None,
-                    trendline="ols",
-                    title="Proporsi Pengeluaran FOMO vs Skor Psikologis",
-                )
-                scatter.update_layout(
-                    xaxis_tickformat="%",
-                    xaxis_title="Proporsi Pengeluaran FOMO",
-                    yaxis_title="Skor Psikologis",
-                )
-                render_plot(scatter)
-            else:
-                st.info("Data proporsi FOMO dan skor psikologis belum lengkap.")
-
-        with rel_row[1]:
-            if {"skor_psikologis", "kemampuan_mengelola_keuangan"}.issubset(df.columns):
-                fig_density = px.density_contour(
-                    df,
-                    x="kemampuan_mengelola_keuangan",
-                    y="skor_psikologis",
-                    color="kategori_fomo" if "kategori_fomo" in df.columns else None,
-                    color_discrete_map={"Sering": SALMON, "Jarang": SKYBLUE},
-                    title="Kepadatan Skor Keuangan dan Psikologis",
-                )
-                fig_density.update_layout(
-                    xaxis_title="Kemampuan Mengelola Keuangan",
-                    yaxis_title="Skor Psikologis",
-                )
-                render_plot(fig_density)
-            else:
-                st.info("Data kemampuan keuangan dan skor psikologis dibutuhkan untuk kontur kepadatan.")
+        tab_psikologis()
 
 # Halaman 3: Eksplorasi Interaktif
-elif menu == "Eksplorasi Interaktif":
+@st.fragment
+def page_eksplorasi() -> None:
     render_banner(
         "Eksplorasi Interaktif",
         "Gunakan filter dinamis untuk meninjau hubungan antar variabel sesuai kebutuhan analisis."
     )
     st.markdown("Gunakan filter di bawah untuk menjelajahi data secara dinamis:")
 
+    opts = filter_options(df)
     col1, col2, col3, col4 = st.columns(4)
     fakultas = (
-        col1.selectbox(
-            "Fakultas", ["Semua"] + sorted(df["fakultas"].dropna().unique().tolist())
-        )
-        if "fakultas" in df.columns
+        col1.selectbox("Fakultas", ["Semua"] + opts["fakultas"])
+        if HAS["fakultas"]
         else "Semua"
     )
     fomo = (
-        col2.selectbox(
-            "Tingkat FOMO", ["Semua"] + sorted(df["kategori_fomo"].dropna().unique().tolist())
-        )
-        if "kategori_fomo" in df.columns
+        col2.selectbox("Tingkat FOMO", ["Semua"] + opts["fomo"])
+        if HAS["fomo"]
         else "Semua"
     )
     keuangan = (
-        col3.selectbox(
-            "Kategori Keuangan",
-            ["Semua"] + sorted(df["kategori_keuangan"].dropna().unique().tolist()),
-        )
-        if "kategori_keuangan" in df.columns
+        col3.selectbox("Kategori Keuangan", ["Semua"] + opts["keuangan"])
+        if HAS["keuangan"]
         else "Semua"
     )
-    if "proporsi_fomo" in df.columns and df["proporsi_fomo"].notna().any():
-        prop_max_val = float(df["proporsi_fomo"].max())
+    if opts["prop_max"] is not None:
+        prop_max_val = opts["prop_max"]
         if not np.isfinite(prop_max_val) or prop_max_val <= 0:
             prop_max_val = 1.0
         step_size = max(round(prop_max_val / 20, 2), 0.05)
@@ -749,85 +1282,60 @@ elif menu == "Eksplorasi Interaktif":
     else:
         prop_range = None
 
-    if "program_studi" in df.columns:
-        program = st.multiselect(
-            "Program Studi", sorted(df["program_studi"].dropna().unique().tolist()), default=[]
-        )
+    if HAS["prodi"]:
+        program = st.multiselect("Program Studi", opts["prodi"], default=[])
     else:
         program = None
 
-    data = df.copy()
-    if fakultas != "Semua":
-        data = data[data["fakultas"] == fakultas]
-    if fomo != "Semua" and "kategori_fomo" in df.columns:
-        data = data[data["kategori_fomo"] == fomo]
-    if keuangan != "Semua" and "kategori_keuangan" in df.columns:
-        data = data[data["kategori_keuangan"] == keuangan]
-    if prop_range and "proporsi_fomo" in df.columns:
-        lower, upper = prop_range
-        data = data[data["proporsi_fomo"].between(lower, upper)]
-    if program:
-        data = data[data["program_studi"].isin(program)]
+    filters = (fakultas, fomo, keuangan, prop_range, tuple(program or ()))
+    views = build_views(df, *filters)
+    data = views["data"]
 
     st.write(f"Menampilkan {len(data)} responden sesuai filter.")
+    if data.empty:
+        # Nothing to plot
+        st.warning("Tidak ada responden pada filter saat ini.")
+        return
 
-    col1, col2 = st.columns(2)
-    if {"skor_fomo_relatif", "skor_psikologis"}.issubset(data.columns):
-        fig1 = px.scatter(
-            data,
-            x="skor_fomo_relatif",
-            y="skor_psikologis",
-            color="kategori_fomo" if "kategori_fomo" in data.columns else None,
-            color_discrete_map={"Sering": SALMON, "Jarang": SKYBLUE},
-            title="Skor FOMO Relatif vs Skor Psikologis",
+    fomo_col = "kategori_fomo" if HAS["fomo"] else None
+    fomo_colors = {"Sering": SALMON, "Jarang": SKYBLUE}
+    panels = []
+    if HAS["fomo_psi"]:
+        panels.append(
+            ("skor_fomo_relatif", fomo_col, fomo_colors, "Skor FOMO Relatif vs Skor Psikologis", "Skor FOMO Relatif")
         )
-        fig1.update_layout(
-            xaxis_title="Skor FOMO Relatif",
-            yaxis_title="Skor Psikologis",
+    elif HAS["freq_psi"]:
+        panels.append(
+            (
+                "frekuensi_fomo_pengeluaran",
+                fomo_col,
+                fomo_colors,
+                "Frekuensi Pengeluaran karena FOMO vs Skor Psikologis",
+                "Frekuensi Pengeluaran karena FOMO",
+            )
         )
-        render_plot(fig1, container=col1)
-    elif {"frekuensi_fomo_pengeluaran", "skor_psikologis"}.issubset(data.columns):
-        fig_alt = px.scatter(
-            data,
-            x="frekuensi_fomo_pengeluaran",
-            y="skor_psikologis",
-            color="kategori_fomo" if "kategori_fomo" in data.columns else None,
-            color_discrete_map={"Sering": SALMON, "Jarang": SKYBLUE},
-            title="Frekuensi Pengeluaran karena FOMO vs Skor Psikologis",
+    if HAS["km_psi"]:
+        keuangan_col = "kategori_keuangan" if HAS["keuangan"] else None
+        keuangan_colors = (
+            dict(zip(data[keuangan_col].cat.categories, [SALMON, SKYBLUE, MINT])) if keuangan_col else {}
         )
-        fig_alt.update_layout(xaxis_title="Frekuensi Pengeluaran karena FOMO", yaxis_title="Skor Psikologis")
-        render_plot(fig_alt, container=col1)
-
-    if {"kemampuan_mengelola_keuangan", "skor_psikologis"}.issubset(data.columns):
-        fig2 = px.scatter(
-            data,
-            x="kemampuan_mengelola_keuangan",
-            y="skor_psikologis",
-            color="kategori_keuangan" if "kategori_keuangan" in data.columns else None,
-            color_discrete_sequence=[SALMON, SKYBLUE, MINT],
-            title="Kemampuan Mengelola Keuangan vs Skor Psikologis",
+        panels.append(
+            (
+                "kemampuan_mengelola_keuangan",
+                keuangan_col,
+                keuangan_colors,
+                "Kemampuan Mengelola Keuangan vs Skor Psikologis",
+                "Kemampuan Mengelola Keuangan",
+            )
         )
-        fig2.update_layout(xaxis_title="Kemampuan Mengelola Keuangan", yaxis_title="Skor Psikologis")
-        render_plot(fig2, container=col2)
+    if panels:
+        show_plot(fig_explore_scatters(filters, tuple(panels), data))
 
     extra_col1, extra_col2 = st.columns(2)
-    if {"kategori_fomo", "indeks_stres"}.issubset(data.columns):
-        stress_breakdown = (
-            data.groupby("kategori_fomo")["indeks_stres"]
-            .mean()
-            .reset_index(name="Indeks Stres Rata-rata")
-        )
+    if HAS["stress"]:
+        stress_breakdown = views["stress"]
         if not stress_breakdown.empty:
-            fig_inter_stress = px.bar(
-                stress_breakdown,
-                x="kategori_fomo",
-                y="Indeks Stres Rata-rata",
-                color="kategori_fomo",
-                color_discrete_map={"Sering": SALMON, "Jarang": SKYBLUE},
-                title="Indeks Stres Rata-rata per Kategori FOMO (Filter Aktif)",
-            )
-            fig_inter_stress.update_layout(xaxis_title="Kategori FOMO", showlegend=False)
-            render_plot(fig_inter_stress, container=extra_col1)
+            show_plot(fig_explore_stress_bar(filters, stress_breakdown), container=extra_col1)
         else:
             with extra_col1:
                 st.info("Tidak ada data indeks stres untuk filter saat ini.")
@@ -835,23 +1343,10 @@ elif menu == "Eksplorasi Interaktif":
         with extra_col1:
             st.info("Data indeks stres tidak tersedia untuk visualisasi.")
 
-    if {"kebutuhan_akan_dukungan_emosional_dan_bantuan_psikologis"}.issubset(data.columns):
-        support_filtered = (
-            data["kebutuhan_akan_dukungan_emosional_dan_bantuan_psikologis"]
-            .value_counts()
-            .reset_index()
-        )
-        support_filtered.columns = ["Kebutuhan Dukungan", "Responden"]
+    if HAS["support"]:
+        support_filtered = views["support"]
         if not support_filtered.empty:
-            fig_support_filtered = px.pie(
-                support_filtered,
-                names="Kebutuhan Dukungan",
-                values="Responden",
-                color="Kebutuhan Dukungan",
-                color_discrete_map={"Ya": SALMON, "Tidak": SKYBLUE},
-                title="Proporsi Kebutuhan Dukungan Emosional (Filter Aktif)",
-            )
-            render_plot(fig_support_filtered, container=extra_col2)
+            show_plot(fig_explore_support_pie(filters, support_filtered), container=extra_col2)
         else:
             with extra_col2:
                 st.info("Tidak ada data dukungan emosional untuk filter saat ini.")
@@ -859,37 +1354,25 @@ elif menu == "Eksplorasi Interaktif":
         with extra_col2:
             st.info("Data dukungan emosional tidak tersedia.")
 
-    if "proporsi_fomo" in data.columns:
+    if HAS["proporsi"]:
         st.markdown("### Ringkasan Tabel")
-        st.dataframe(
-            data[
-                [
-                    col
-                    for col in [
-                        "nama_lengkap",
-                        "fakultas",
-                        "program_studi",
-                        "kategori_fomo",
-                        "kategori_keuangan",
-                        "proporsi_fomo",
-                        "skor_psikologis",
-                    ]
-                    if col in data.columns
-                ]
-            ].rename(columns={"proporsi_fomo": "Proporsi FOMO", "skor_psikologis": "Skor Psikologis"}),
-            width="stretch",
-        )
+        st.dataframe(views["summary"], width="stretch")
 
 # Halaman 4: Kesimpulan
-else:
+def page_kesimpulan() -> None:
     render_banner(
         "Kesimpulan",
         "Ringkasan temuan utama dan rekomendasi tindak lanjut dari hasil analisis dashboard."
     )
     st.title("Kesimpulan Umum")
-    st.markdown("""
-    Berdasarkan hasil analisis:
-    - Mahasiswa dengan **tingkat FOMO tinggi** cenderung memiliki **kemampuan pengelolaan keuangan yang rendah**.
-    - Semakin **baik kemampuan finansial**, semakin **stabil kesejahteraan psikologis**.
-    - Diperlukan peningkatan **literasi keuangan dan kesadaran digital** di kalangan mahasiswa.
-    """)
+    st.markdown(KESIMPULAN_MD)
+
+menu = st.session_state["page"]
+if menu == "Pendahuluan":
+    page_pendahuluan()
+elif menu == "Analisis & Visualisasi":
+    page_analisis()
+elif menu == "Eksplorasi Interaktif":
+    page_eksplorasi()
+else:
+    page_kesimpulan()